@@ -0,0 +1,31 @@
+"""
+Tests for VolvoAuth
+"""
+
+import unittest
+
+from volvo_api.auth import VolvoAuth
+from volvo_api.exceptions import AuthenticationError
+
+
+class ExtractCodeFromCallbackUrlTest(unittest.TestCase):
+    def test_returns_code_and_state(self):
+        code, state = VolvoAuth.extract_code_from_callback_url(
+            "https://example.com/cb?code=a%2Bb&state=xyz"
+        )
+
+        self.assertEqual((code, state), ("a+b", "xyz"))
+
+    def test_error_after_code_and_state_still_raises(self):
+        with self.assertRaisesRegex(AuthenticationError, "Authorization failed: oops"):
+            VolvoAuth.extract_code_from_callback_url(
+                "https://example.com/cb?code=abc&state=s&error=oops"
+            )
+
+    def test_missing_code_raises(self):
+        with self.assertRaises(AuthenticationError):
+            VolvoAuth.extract_code_from_callback_url("https://example.com/cb?state=s")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for VolvoAPIClient
+"""
+
+import unittest
+from unittest import mock
+
+from volvo_api.client import VolvoAPIClient
+
+
+class FakeAuth:
+    """Auth stand-in that always hands out the same token"""
+
+    def get_access_token(self):
+        return "token"
+
+
+def _json_response(body: bytes, status_code: int = 200, headers=None):
+    """Build a fake response carrying a JSON body"""
+    response = mock.Mock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json", **(headers or {})}
+    response.content = body
+    response.text = body.decode()
+    return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.client = VolvoAPIClient(auth=FakeAuth(), vcc_api_key="key")
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = _json_response(
+            b'{"data": {"odometer": {"value": 1234}}}'
+        )
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_cache_hit_skips_request(self):
+        self.client.get_odometer("V1")
+        self.client.get_odometer("V1")
+
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_mutating_result_does_not_corrupt_cache(self):
+        first = self.client.get_odometer("V1")
+        first["x"] = 999
+        first["odometer"]["value"] = 0
+
+        second = self.client.get_odometer("V1")
+        second["y"] = 1
+
+        self.assertEqual(self.client.get_odometer("V1"), {"odometer": {"value": 1234}})
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        self.client = VolvoAPIClient(auth=FakeAuth(), vcc_api_key="key")
+        self.client._session = mock.Mock()
+
+    def tearDown(self):
+        self.client.close()
+
+    @mock.patch("volvo_api.client.time.sleep")
+    def test_negative_retry_after_is_clamped(self, sleep):
+        self.client._session.request.side_effect = [
+            _json_response(b"{}", status_code=429, headers={"Retry-After": "-1"}),
+            _json_response(b'{"data": {"status": "ok"}}'),
+        ]
+
+        self.assertEqual(self.client.lock_vehicle("V1"), {"status": "ok"})
+        sleep.assert_called_once_with(0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Tests for the Volvo API exception types
+"""
+
+import copy
+import pickle
+import unittest
+
+from volvo_api.exceptions import RateLimitError, VolvoAPIError
+
+
+class ExceptionStateTest(unittest.TestCase):
+    def assertSameError(self, original, restored):
+        self.assertIs(type(restored), type(original))
+        self.assertEqual(restored.message, original.message)
+        self.assertEqual(restored.status_code, original.status_code)
+        self.assertEqual(restored.response_data, original.response_data)
+        self.assertEqual(restored.args, original.args)
+
+    def test_pickle_round_trip_keeps_fields(self):
+        error = RateLimitError(
+            "Rate limit exceeded", status_code=429, response_data={"retry_after": 5}
+        )
+
+        self.assertSameError(error, pickle.loads(pickle.dumps(error)))
+
+    def test_copy_keeps_fields(self):
+        error = VolvoAPIError("boom", status_code=500, response_data={"a": 1})
+
+        self.assertSameError(error, copy.copy(error))
+        self.assertSameError(error, copy.deepcopy(error))
+
+    def test_default_response_data_is_json_friendly_dict(self):
+        self.assertEqual(VolvoAPIError("boom").response_data, {})
+        self.assertIsInstance(VolvoAPIError("boom").response_data, dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,8 +16,18 @@ from .exceptions import AuthenticationError, RateLimitError, VolvoAPIError
 __all__ = [
     "VolvoAuth",
     "VolvoAPIClient",
+    "AsyncVolvoAPIClient",
     "VolvoConfig",
     "VolvoAPIError",
     "AuthenticationError",
     "RateLimitError",
 ]
+
+
+def __getattr__(name):
+    # Loaded on first use so sync-only users don't pay for importing httpx
+    if name == "AsyncVolvoAPIClient":
+        from .async_client import AsyncVolvoAPIClient
+
+        return AsyncVolvoAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
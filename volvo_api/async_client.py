@@ -0,0 +1,491 @@
+"""
+Asynchronous Volvo Cars API Client
+
+This module mirrors VolvoAPIClient on top of httpx.AsyncClient so that
+several endpoints can be fetched concurrently over one HTTP/2 connection.
+Requires the optional httpx package (pip install "httpx[http2]").
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # Optional, only needed for AsyncVolvoAPIClient
+    httpx = None
+
+from .auth import VolvoAuth
+from .client import (
+    _EP_BRAKE_FLUID,
+    _EP_CLIMATE_START,
+    _EP_CLIMATE_STOP,
+    _EP_DOORS,
+    _EP_ENERGY_CAPABILITIES,
+    _EP_ENERGY_STATE,
+    _EP_ENGINE_START,
+    _EP_ENGINE_STOP,
+    _EP_FUEL,
+    _EP_LOCATION,
+    _EP_LOCK,
+    _EP_ODOMETER,
+    _EP_TYRES,
+    _EP_UNLOCK,
+    _EP_VEHICLE,
+    _EP_VEHICLES,
+    _EP_WARNINGS,
+    _EP_WASHER_FLUID,
+    _EP_WINDOWS,
+    _handle_response,
+)
+from .exceptions import AuthenticationError, VolvoAPIError
+
+
+class AsyncVolvoAPIClient:
+    """
+    Asyncio client for interacting with Volvo Cars API
+    """
+
+    # Volvo API base URL
+    API_BASE_URL = "https://api.volvocars.com"
+
+    def __init__(
+        self,
+        auth: VolvoAuth,
+        vcc_api_key: str,
+        api_base_url: Optional[str] = None,
+        timeout: int = 30,
+        http2: bool = True,
+    ):
+        """
+        Initialize async Volvo API client
+
+        Args:
+            auth: Authenticated VolvoAuth instance
+            vcc_api_key: VCC API key from your Volvo Developer Portal application
+            api_base_url: Override default API base URL
+            timeout: Request timeout in seconds
+            http2: Multiplex concurrent requests over one HTTP/2 connection
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncVolvoAPIClient: pip install 'httpx[http2]'"
+            )
+
+        self.auth = auth
+        self.vcc_api_key = vcc_api_key
+        self.api_base_url = api_base_url or self.API_BASE_URL
+        self.timeout = timeout
+
+        # Created lazily so it binds to the loop the client is used from
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base_url,
+            http2=http2,
+            timeout=timeout,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "vcc-api-key": vcc_api_key,
+            },
+        )
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP client and release its connections
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _get_access_token(self) -> str:
+        """
+        Get a valid access token without blocking the event loop
+
+        Only one task refreshes at a time; the others wait for its result.
+        """
+        access_token = self.auth.peek_access_token()
+        if access_token is not None:
+            return access_token
+
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+
+        async with self._auth_lock:
+            # Another task may have refreshed while we were waiting
+            access_token = self.auth.peek_access_token()
+            if access_token is None:
+                loop = asyncio.get_running_loop()
+                access_token = await loop.run_in_executor(
+                    None, self.auth.get_access_token
+                )
+            return access_token
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make authenticated request to Volvo API
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            data: Form data
+            json_data: JSON data
+
+        Returns:
+            JSON response data
+
+        Raises:
+            VolvoAPIError: For API errors
+            AuthenticationError: For auth errors
+            RateLimitError: When rate limited
+        """
+        # Get valid access token
+        try:
+            access_token = await self._get_access_token()
+        except Exception as e:
+            raise AuthenticationError(f"Failed to get access token: {str(e)}") from e
+
+        try:
+            response = await self._client.request(
+                method.upper(),
+                endpoint,
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+                json=json_data,
+                data=data,
+            )
+
+            return _handle_response(response)
+
+        except httpx.HTTPError as e:
+            raise VolvoAPIError(f"Request failed: {str(e)}") from e
+
+    async def snapshot(self, vin: str) -> Dict[str, Any]:
+        """
+        Fetch the commonly used status endpoints for a vehicle concurrently
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Dictionary with details, energy_state, odometer, location,
+            doors and warnings for the vehicle
+        """
+        results = await asyncio.gather(
+            self.get_vehicle_details(vin),
+            self.get_energy_state(vin),
+            self.get_odometer(vin),
+            self.get_location(vin),
+            self.get_doors_status(vin),
+            self.get_warnings(vin),
+        )
+        keys = ("details", "energy_state", "odometer", "location", "doors", "warnings")
+        return dict(zip(keys, results))
+
+    async def get_vehicles(self) -> List[Dict[str, Any]]:
+        """
+        Get list of vehicles associated with the account
+
+        Returns:
+            List of vehicle information
+        """
+        response = await self._make_request("GET", _EP_VEHICLES)
+        return response.get("data", [])
+
+    async def get_vehicle_details(self, vin: str) -> Dict[str, Any]:
+        """
+        Get detailed information about a specific vehicle
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Vehicle details
+        """
+        response = await self._make_request("GET", _EP_VEHICLE.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_energy_state(self, vin: str) -> Dict[str, Any]:
+        """
+        Get comprehensive energy state for electric/hybrid vehicle (Energy API v2)
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Energy state information
+        """
+        # Energy API v2 returns data directly, not wrapped in "data" field
+        return await self._make_request("GET", _EP_ENERGY_STATE.format(vin=vin))
+
+    async def get_energy_capabilities(self, vin: str) -> Dict[str, Any]:
+        """
+        Get energy capabilities for the vehicle (Energy API v2)
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Energy capabilities information including supported features
+        """
+        response = await self._make_request(
+            "GET", _EP_ENERGY_CAPABILITIES.format(vin=vin)
+        )
+        return response.get("data", {})
+
+    async def get_battery_charge_level(self, vin: str) -> Dict[str, Any]:
+        """
+        Get battery charge level for electric/hybrid vehicle
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Battery charge level information
+        """
+        energy_state = await self.get_energy_state(vin)
+        battery_info = energy_state.get("batteryChargeLevel", {})
+
+        # Return in a format consistent with other endpoints
+        if battery_info.get("status") == "OK":
+            return {"batteryChargeLevel": battery_info}
+        else:
+            return battery_info
+
+    async def get_fuel_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get fuel status for the vehicle
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Fuel status information
+        """
+        response = await self._make_request("GET", _EP_FUEL.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_odometer(self, vin: str) -> Dict[str, Any]:
+        """
+        Get odometer reading
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Odometer information
+        """
+        response = await self._make_request("GET", _EP_ODOMETER.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_location(self, vin: str) -> Dict[str, Any]:
+        """
+        Get vehicle location (if available and permitted)
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Location information
+        """
+        response = await self._make_request("GET", _EP_LOCATION.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_engine_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get engine status and diagnostics (alias for get_energy_state)
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Energy state information (same as get_energy_state)
+        """
+        return await self.get_energy_state(vin)
+
+    async def get_warnings(self, vin: str) -> List[Dict[str, Any]]:
+        """
+        Get vehicle warnings and alerts
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            List of warnings
+        """
+        response = await self._make_request("GET", _EP_WARNINGS.format(vin=vin))
+        return response.get("data", [])
+
+    async def get_doors_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get doors and windows status
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Doors and windows status
+        """
+        response = await self._make_request("GET", _EP_DOORS.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_windows_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get windows status
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Windows status information
+        """
+        response = await self._make_request("GET", _EP_WINDOWS.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_brake_fluid_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get brake fluid status
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Brake fluid status
+        """
+        response = await self._make_request("GET", _EP_BRAKE_FLUID.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_washer_fluid_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get washer fluid status
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Washer fluid status
+        """
+        response = await self._make_request("GET", _EP_WASHER_FLUID.format(vin=vin))
+        return response.get("data", {})
+
+    async def get_tyre_status(self, vin: str) -> Dict[str, Any]:
+        """
+        Get tyre pressure and status
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Tyre status information
+        """
+        response = await self._make_request("GET", _EP_TYRES.format(vin=vin))
+        return response.get("data", {})
+
+    # Command methods (require appropriate permissions)
+
+    async def lock_vehicle(self, vin: str) -> Dict[str, Any]:
+        """
+        Lock the vehicle
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Command result
+        """
+        response = await self._make_request("POST", _EP_LOCK.format(vin=vin))
+        return response.get("data", {})
+
+    async def unlock_vehicle(self, vin: str) -> Dict[str, Any]:
+        """
+        Unlock the vehicle
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Command result
+        """
+        response = await self._make_request("POST", _EP_UNLOCK.format(vin=vin))
+        return response.get("data", {})
+
+    async def start_engine(self, vin: str, runtime_minutes: int = 15) -> Dict[str, Any]:
+        """
+        Start the engine remotely (if supported)
+
+        Args:
+            vin: Vehicle identification number
+            runtime_minutes: How long to run the engine
+
+        Returns:
+            Command result
+        """
+        json_data = {"runtime": runtime_minutes}
+        response = await self._make_request(
+            "POST",
+            _EP_ENGINE_START.format(vin=vin),
+            json_data=json_data,
+        )
+        return response.get("data", {})
+
+    async def stop_engine(self, vin: str) -> Dict[str, Any]:
+        """
+        Stop the engine remotely (if supported)
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Command result
+        """
+        response = await self._make_request("POST", _EP_ENGINE_STOP.format(vin=vin))
+        return response.get("data", {})
+
+    async def start_climate(
+        self, vin: str, temperature: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Start climate control
+
+        Args:
+            vin: Vehicle identification number
+            temperature: Target temperature in Celsius
+
+        Returns:
+            Command result
+        """
+        json_data = {}
+        if temperature is not None:
+            json_data["temperature"] = temperature
+
+        response = await self._make_request(
+            "POST",
+            _EP_CLIMATE_START.format(vin=vin),
+            json_data=json_data,
+        )
+        return response.get("data", {})
+
+    async def stop_climate(self, vin: str) -> Dict[str, Any]:
+        """
+        Stop climate control
+
+        Args:
+            vin: Vehicle identification number
+
+        Returns:
+            Command result
+        """
+        response = await self._make_request("POST", _EP_CLIMATE_STOP.format(vin=vin))
+        return response.get("data", {})
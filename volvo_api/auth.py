@@ -8,21 +8,39 @@ This module handles OAuth2 authentication flow including:
 - PKCE (Proof Key for Code Exchange) support
 """
 
+import asyncio
 import base64
-import hashlib
 import json
 import logging
 import os
 import secrets
+import threading
+import time
 import urllib.parse
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, urlencode, urlparse
+from datetime import datetime
+from hashlib import sha256 as _sha256
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import AuthenticationError, InvalidTokenError
 
+try:
+    import orjson
+except ImportError:  # Optional, speeds up token file (de)serialization
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 class VolvoAuth:
     """
@@ -34,12 +52,15 @@ class VolvoAuth:
     AUTH_ENDPOINT = f"{AUTH_BASE_URL}/as/authorization.oauth2"
     TOKEN_ENDPOINT = f"{AUTH_BASE_URL}/as/token.oauth2"
 
+    # Form body prefix for refresh requests; only the token itself varies
+    _REFRESH_BODY_PREFIX = b"grant_type=refresh_token&refresh_token="
+
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         redirect_uri: str,
-        scopes: Optional[List[str]] = None,
+        scopes: Optional[Sequence[str]] = None,
         use_pkce: bool = True,
         token_storage_path: Optional[str] = None,
     ):
@@ -50,33 +71,70 @@ class VolvoAuth:
             client_id: Your application's client ID
             client_secret: Your application's client secret
             redirect_uri: Registered redirect URI for your application
-            scopes: List of requested scopes (permissions)
+            scopes: Requested scopes (permissions)
             use_pkce: Whether to use PKCE (recommended for security)
             token_storage_path: Path to store tokens persistently
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
-        self.scopes = scopes or [
-            "openid",
-            "conve:battery_charge_level",
-            "conve:commands",
-            "conve:brake_status",
-            "conve:diagnostics_engine_status",
-            "conve:fuel_status",
-            "conve:vehicle_relation",
-            "conve:warnings",
-        ]
+        self.scopes: Tuple[str, ...] = tuple(
+            scopes
+            or (
+                "openid",
+                "conve:battery_charge_level",
+                "conve:commands",
+                "conve:brake_status",
+                "conve:diagnostics_engine_status",
+                "conve:fuel_status",
+                "conve:vehicle_relation",
+                "conve:warnings",
+            )
+        )
         self.use_pkce = use_pkce
         self.token_storage_path = token_storage_path or "tokens.json"
 
+        # The static part of the authorization URL query never changes
+        self._scopes_joined = " ".join(self.scopes)
+        self._base_params_encoded = urlencode(
+            {
+                "response_type": "code",
+                "client_id": client_id,
+                "redirect_uri": redirect_uri,
+                "scope": self._scopes_joined,
+            }
+        )
+
+        # Client credentials never change, so build the Basic auth header once
+        credentials = f"{client_id}:{client_secret}"
+        self._basic_auth_header = (
+            "Basic " + base64.b64encode(credentials.encode()).decode()
+        )
+
+        # Reuse one keep-alive connection to the token endpoint across refreshes
+        self._session = requests.Session()
+        self._session.mount(
+            self.AUTH_BASE_URL, HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        )
+
+        # Serializes synchronous refreshes across threads
+        self._refresh_lock = threading.Lock()
+
+        # Async refresh currently in flight, bound to the loop that started it
+        self._refresh_task: Optional[asyncio.Task] = None
+
         # Setup logger for debugging
         self.logger = logging.getLogger(__name__)
 
         # Token storage
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        # Expiry as a Unix timestamp; plain float comparisons keep checks cheap
+        self._token_expires_at_ts: Optional[float] = None
+        # (token, monotonic deadline) pair for a token known to be fresh
+        self._fresh_token: Tuple[Optional[str], float] = (None, 0.0)
+        # Modification time of the token file as last read or written by us
+        self._tokens_mtime: Optional[int] = None
 
         # PKCE parameters
         self._code_verifier: Optional[str] = None
@@ -92,17 +150,15 @@ class VolvoAuth:
         Returns:
             Tuple of (code_verifier, code_challenge)
         """
-        # Generate code verifier (43-128 character string)
-        self._code_verifier = (
-            base64.urlsafe_b64encode(secrets.token_bytes(32))
-            .decode("utf-8")
-            .rstrip("=")
-        )
+        # Generate code verifier (43-128 character string), kept as bytes
+        # until it is stored so it can be hashed without re-encoding
+        verifier_bytes = base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=")
+        self._code_verifier = verifier_bytes.decode("ascii")
 
         # Generate code challenge (SHA256 hash of verifier)
-        challenge_bytes = hashlib.sha256(self._code_verifier.encode("utf-8")).digest()
+        challenge_bytes = _sha256(verifier_bytes).digest()
         self._code_challenge = (
-            base64.urlsafe_b64encode(challenge_bytes).decode("utf-8").rstrip("=")
+            base64.urlsafe_b64encode(challenge_bytes).rstrip(b"=").decode("ascii")
         )
 
         return self._code_verifier, self._code_challenge
@@ -117,22 +173,20 @@ class VolvoAuth:
         Returns:
             Authorization URL to redirect user to
         """
-        params = {
-            "response_type": "code",
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "scope": " ".join(self.scopes),
-        }
+        query = self._base_params_encoded
 
         if state:
-            params["state"] = state
+            query += "&state=" + urllib.parse.quote_plus(state)
 
         if self.use_pkce:
             self._generate_pkce_parameters()
-            params["code_challenge"] = self._code_challenge
-            params["code_challenge_method"] = "S256"
+            query += (
+                "&code_challenge="
+                + urllib.parse.quote_plus(self._code_challenge)
+                + "&code_challenge_method=S256"
+            )
 
-        return f"{self.AUTH_ENDPOINT}?{urlencode(params)}"
+        return f"{self.AUTH_ENDPOINT}?{query}"
 
     def exchange_code_for_tokens(self, authorization_code: str) -> Dict[str, any]:
         """
@@ -147,13 +201,9 @@ class VolvoAuth:
         Raises:
             AuthenticationError: If token exchange fails
         """
-        # Prepare authentication header
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": f"Basic {encoded_credentials}",
+            "Authorization": self._basic_auth_header,
         }
 
         data = {
@@ -167,10 +217,12 @@ class VolvoAuth:
             data["code_verifier"] = self._code_verifier
 
         try:
-            response = requests.post(self.TOKEN_ENDPOINT, headers=headers, data=data)
+            response = self._session.post(
+                self.TOKEN_ENDPOINT, headers=headers, data=data
+            )
             response.raise_for_status()
 
-            token_data = response.json()
+            token_data = _json_loads(response.content)
 
             # Store tokens
             self._access_token = token_data.get("access_token")
@@ -178,14 +230,15 @@ class VolvoAuth:
 
             # Calculate expiration time
             expires_in = token_data.get("expires_in", 3600)  # Default to 1 hour
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+            self._token_expires_at_ts = time.time() + expires_in
+            self._set_fresh_deadline(expires_in)
 
             # Save tokens to file
             self._save_tokens()
 
             return token_data
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise AuthenticationError(f"Token exchange failed: {str(e)}")
 
     def refresh_access_token(self) -> Dict[str, any]:
@@ -198,80 +251,180 @@ class VolvoAuth:
         Raises:
             AuthenticationError: If token refresh fails
         """
+        headers, body = self._prepare_refresh()
+
+        try:
+            self.logger.debug("Making token refresh request to %s", self.TOKEN_ENDPOINT)
+            response = self._session.post(
+                self.TOKEN_ENDPOINT, headers=headers, data=body, timeout=30
+            )
+            response.raise_for_status()
+
+            token_data = _json_loads(response.content)
+            self.logger.debug("Token refresh response received successfully")
+
+            return self._apply_refresh_response(token_data)
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.error("❌ Token refresh failed: %s", str(e))
+            raise AuthenticationError(f"Token refresh failed: {str(e)}") from e
+
+    async def refresh_access_token_async(self) -> Dict[str, any]:
+        """
+        Refresh the access token without blocking the event loop
+
+        Concurrent callers on the same event loop share a single in-flight
+        refresh request instead of each hitting the token endpoint. Intended
+        for applications already running aiohttp; requires the optional
+        aiohttp package.
+
+        Returns:
+            Dictionary containing new token information
+
+        Raises:
+            AuthenticationError: If token refresh fails
+        """
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+
+        # A task left over from another (possibly closed) loop can't be awaited
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._refresh_task = loop.create_task(self._refresh_once_async())
+
+        # Shield the shared refresh so one cancelled caller doesn't abort it
+        return await asyncio.shield(task)
+
+    async def _refresh_once_async(self) -> Dict[str, any]:
+        """Perform a single async token refresh request"""
+        # Imported here so sync-only users don't pay for aiohttp at import time
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "aiohttp is required for async token refresh: pip install aiohttp"
+            ) from e
+
+        headers, body = self._prepare_refresh()
+
+        try:
+            self.logger.debug("Making token refresh request to %s", self.TOKEN_ENDPOINT)
+            # A session per refresh: sessions are bound to the loop that
+            # created them, and refreshes are far too rare to need pooling
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as session:
+                async with session.post(
+                    self.TOKEN_ENDPOINT, headers=headers, data=body
+                ) as response:
+                    response.raise_for_status()
+                    token_data = _json_loads(await response.read())
+            self.logger.debug("Token refresh response received successfully")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("❌ Token refresh failed: %s", str(e))
+            raise AuthenticationError(f"Token refresh failed: {str(e)}") from e
+
+        return self._apply_refresh_response(token_data)
+
+    def _prepare_refresh(self) -> Tuple[Dict[str, str], bytes]:
+        """
+        Build headers and the URL-encoded form body for a refresh token request
+
+        Returns:
+            Tuple of (headers, body)
+
+        Raises:
+            AuthenticationError: If no refresh token is available
+        """
         if not self._refresh_token:
             self.logger.debug("Token refresh attempted but no refresh token available")
             raise AuthenticationError("No refresh token available")
 
         # Log refresh attempt
-        current_expiry = (
-            self._token_expires_at.isoformat() if self._token_expires_at else "unknown"
-        )
-        self.logger.info(
-            "🔄 Refreshing access token (current expires: %s)", current_expiry
-        )
-
-        # Prepare authentication header
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        if self.logger.isEnabledFor(logging.INFO):
+            current_expiry = (
+                datetime.fromtimestamp(self._token_expires_at_ts).isoformat()
+                if self._token_expires_at_ts
+                else "unknown"
+            )
+            self.logger.info(
+                "🔄 Refreshing access token (current expires: %s)", current_expiry
+            )
 
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": f"Basic {encoded_credentials}",
+            "Authorization": self._basic_auth_header,
         }
 
-        data = {"grant_type": "refresh_token", "refresh_token": self._refresh_token}
+        body = self._REFRESH_BODY_PREFIX + urllib.parse.quote_plus(
+            self._refresh_token
+        ).encode("ascii")
 
-        try:
-            self.logger.debug("Making token refresh request to %s", self.TOKEN_ENDPOINT)
-            response = requests.post(
-                self.TOKEN_ENDPOINT, headers=headers, data=data, timeout=30
-            )
-            response.raise_for_status()
+        return headers, body
 
-            token_data = response.json()
-            self.logger.debug("Token refresh response received successfully")
-
-            # Update tokens
-            old_access_token = (
-                self._access_token[:20] + "..." if self._access_token else None
-            )
-            self._access_token = token_data.get("access_token")
-
-            # Some implementations return new refresh token, some don't
-            new_refresh_token = token_data.get("refresh_token")
-            if new_refresh_token:
-                self.logger.debug("New refresh token received in response")
-                self._refresh_token = new_refresh_token
-            else:
-                self.logger.debug(
-                    "Using existing refresh token (none provided in response)"
-                )
+    def _apply_refresh_response(self, token_data: Dict[str, any]) -> Dict[str, any]:
+        """
+        Store tokens from a successful refresh response and persist them
 
-            # Calculate expiration time
-            expires_in = token_data.get("expires_in", 3600)
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+        Args:
+            token_data: Parsed token endpoint response
 
-            new_access_token = (
-                self._access_token[:20] + "..." if self._access_token else None
+        Returns:
+            The token data passed in
+        """
+        # Update tokens
+        old_access_token = self._access_token
+        self._access_token = token_data.get("access_token")
+
+        # Some implementations return new refresh token, some don't
+        new_refresh_token = token_data.get("refresh_token")
+        if new_refresh_token:
+            self.logger.debug("New refresh token received in response")
+            self._refresh_token = new_refresh_token
+        else:
+            self.logger.debug(
+                "Using existing refresh token (none provided in response)"
             )
-            new_expiry = self._token_expires_at.isoformat()
 
+        # Calculate expiration time
+        expires_in = token_data.get("expires_in", 3600)
+        self._token_expires_at_ts = time.time() + expires_in
+        self._set_fresh_deadline(expires_in)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            new_expiry = datetime.fromtimestamp(self._token_expires_at_ts).isoformat()
             self.logger.info(
                 "✅ Token refresh successful! New token expires: %s", new_expiry
             )
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                "Token changed from %s to %s", old_access_token, new_access_token
+                "Token changed from %s to %s",
+                self._truncate_token(old_access_token),
+                self._truncate_token(self._access_token),
             )
 
-            # Save updated tokens
-            self._save_tokens()
-            self.logger.debug("Updated tokens saved to %s", self.token_storage_path)
+        # Save updated tokens
+        self._save_tokens()
+        self.logger.debug("Updated tokens saved to %s", self.token_storage_path)
 
-            return token_data
+        return token_data
 
-        except requests.exceptions.RequestException as e:
-            self.logger.error("❌ Token refresh failed: %s", str(e))
-            raise AuthenticationError(f"Token refresh failed: {str(e)}") from e
+    @staticmethod
+    def _truncate_token(token: Optional[str]) -> Optional[str]:
+        """Shorten a token for logging"""
+        return token[:20] + "..." if token else None
+
+    def _set_fresh_deadline(self, expires_in: float):
+        """
+        Record when the current token stops being fresh (5 minute buffer)
+
+        Args:
+            expires_in: Seconds until the access token expires
+        """
+        self._fresh_token = (
+            self._access_token,
+            time.monotonic() + expires_in - 300,
+        )
 
     def get_access_token(self) -> str:
         """
@@ -283,6 +436,33 @@ class VolvoAuth:
         Raises:
             InvalidTokenError: If no valid token is available
         """
+        # Fast path: token is known to be fresh, skip all expiry bookkeeping
+        token, deadline = self._fresh_token
+        if token and time.monotonic() < deadline:
+            return token
+
+        return self._slow_get_access_token()
+
+    def peek_access_token(self) -> Optional[str]:
+        """
+        Get the access token only if it is known to be fresh
+
+        Never refreshes or touches disk, so it is safe to call from an event
+        loop before deciding whether a (blocking) refresh is needed.
+
+        Returns:
+            Access token, or None if it may need refreshing
+        """
+        token, deadline = self._fresh_token
+        if token and time.monotonic() < deadline:
+            return token
+        return None
+
+    def _slow_get_access_token(self) -> str:
+        """Check expiry, reloading and refreshing the token as needed"""
+        # Pick up tokens refreshed by another process sharing the token file
+        self._maybe_reload_tokens()
+
         if not self._access_token:
             self.logger.debug("No access token available")
             raise InvalidTokenError(
@@ -290,27 +470,31 @@ class VolvoAuth:
             )
 
         # Check if token is expired (with 5 minute buffer)
-        now = datetime.now()
-        if self._token_expires_at:
-            time_until_expiry = self._token_expires_at - now
-            buffer_time = self._token_expires_at - timedelta(minutes=5)
+        now = time.time()
+        if self._token_expires_at_ts:
+            time_until_expiry = self._token_expires_at_ts - now
+            buffer_time = self._token_expires_at_ts - 300
 
-            self.logger.debug(
-                "Checking token expiry: expires at %s, buffer at %s, now is %s",
-                self._token_expires_at.isoformat(),
-                buffer_time.isoformat(),
-                now.isoformat(),
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Checking token expiry: expires at %s, buffer at %s, now is %s",
+                    datetime.fromtimestamp(self._token_expires_at_ts).isoformat(),
+                    datetime.fromtimestamp(buffer_time).isoformat(),
+                    datetime.fromtimestamp(now).isoformat(),
+                )
 
             if now >= buffer_time:
                 self.logger.info(
-                    "🕐 Token expires soon (in %s), refreshing...",
-                    str(time_until_expiry),
+                    "🕐 Token expires soon (in %.0fs), refreshing...",
+                    time_until_expiry,
                 )
 
                 if self._refresh_token:
                     try:
-                        self.refresh_access_token()
+                        with self._refresh_lock:
+                            # Another thread may have refreshed while we waited
+                            if time.time() >= self._token_expires_at_ts - 300:
+                                self.refresh_access_token()
                     except AuthenticationError as exc:
                         self.logger.error(
                             "Token refresh failed, re-authentication required"
@@ -324,9 +508,7 @@ class VolvoAuth:
                         "Token expired and no refresh token available. Please re-authenticate."
                     )
             else:
-                self.logger.debug(
-                    "Token is valid, expires in %s", str(time_until_expiry)
-                )
+                self.logger.debug("Token is valid, expires in %.0fs", time_until_expiry)
         else:
             self.logger.warning(
                 "No token expiration time available, using current token"
@@ -346,7 +528,7 @@ class VolvoAuth:
             self.logger.debug("Authentication check: valid token available")
             return True
         except InvalidTokenError as e:
-            self.logger.debug("Authentication check failed: %s", str(e))
+            self.logger.debug("Authentication check failed: %s", e)
             return False
 
     def logout(self):
@@ -355,7 +537,9 @@ class VolvoAuth:
         """
         self._access_token = None
         self._refresh_token = None
-        self._token_expires_at = None
+        self._token_expires_at_ts = None
+        self._fresh_token = (None, 0.0)
+        self._tokens_mtime = None
         self._code_verifier = None
         self._code_challenge = None
 
@@ -363,6 +547,23 @@ class VolvoAuth:
         if os.path.exists(self.token_storage_path):
             os.remove(self.token_storage_path)
 
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
     def _save_tokens(self):
         """Save tokens to persistent storage"""
         if not self.token_storage_path:
@@ -372,14 +573,23 @@ class VolvoAuth:
         token_data = {
             "access_token": self._access_token,
             "refresh_token": self._refresh_token,
-            "expires_at": (
-                self._token_expires_at.isoformat() if self._token_expires_at else None
-            ),
+            "expires_at": self._token_expires_at_ts,
         }
 
+        # Write to a private temp file and rename it into place so concurrent
+        # readers never observe a partially written token file
+        tmp_path = self.token_storage_path + ".tmp"
+        payload = _json_dumps(token_data)
+
         try:
-            with open(self.token_storage_path, "w", encoding="utf-8") as f:
-                json.dump(token_data, f, indent=2)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.token_storage_path)
+            self._tokens_mtime = os.stat(self.token_storage_path).st_mtime_ns
             self.logger.debug("💾 Tokens saved to %s", self.token_storage_path)
         except IOError as e:
             self.logger.warning(
@@ -392,37 +602,62 @@ class VolvoAuth:
             self.logger.debug("No token storage path configured, skipping load")
             return
 
-        if not os.path.exists(self.token_storage_path):
+        try:
+            mtime = os.stat(self.token_storage_path).st_mtime_ns
+        except OSError:
             self.logger.debug(
                 "Token file %s does not exist, starting fresh", self.token_storage_path
             )
             return
 
+        # Remember the version we read so a broken file isn't re-parsed each call
+        self._tokens_mtime = mtime
+
         try:
-            with open(self.token_storage_path, "r", encoding="utf-8") as f:
-                token_data = json.load(f)
+            with open(self.token_storage_path, "rb") as f:
+                token_data = _json_loads(f.read())
 
             self._access_token = token_data.get("access_token")
             self._refresh_token = token_data.get("refresh_token")
 
-            expires_at_str = token_data.get("expires_at")
-            if expires_at_str:
-                self._token_expires_at = datetime.fromisoformat(expires_at_str)
+            expires_at = token_data.get("expires_at")
+            if expires_at:
+                if isinstance(expires_at, str):
+                    # Legacy token files store the expiry as an ISO timestamp
+                    expires_at = datetime.fromisoformat(expires_at).timestamp()
+                self._token_expires_at_ts = float(expires_at)
+                self._set_fresh_deadline(self._token_expires_at_ts - time.time())
                 self.logger.debug(
                     "📂 Loaded tokens from %s (expires: %s)",
                     self.token_storage_path,
-                    expires_at_str,
+                    expires_at,
                 )
             else:
                 self.logger.debug(
                     "📂 Loaded tokens from %s (no expiry info)", self.token_storage_path
                 )
 
-        except (IOError, json.JSONDecodeError, ValueError) as e:
+        except (IOError, json.JSONDecodeError, TypeError, ValueError) as e:
             self.logger.warning(
                 "Failed to load tokens from %s: %s", self.token_storage_path, str(e)
             )
 
+    def _maybe_reload_tokens(self):
+        """Reload tokens if the token file changed since we last read or wrote it"""
+        if not self.token_storage_path:
+            return
+
+        try:
+            mtime = os.stat(self.token_storage_path).st_mtime_ns
+        except OSError:
+            return
+
+        if mtime != self._tokens_mtime:
+            self.logger.debug(
+                "Token file %s changed on disk, reloading", self.token_storage_path
+            )
+            self._load_tokens()
+
     @staticmethod
     def extract_code_from_callback_url(callback_url: str) -> Tuple[str, Optional[str]]:
         """
@@ -437,23 +672,40 @@ class VolvoAuth:
         Raises:
             AuthenticationError: If no code found in URL
         """
-        parsed = urlparse(callback_url)
-        params = parse_qs(parsed.query)
+        # Cheap rejection before doing any parsing work
+        if "code=" not in callback_url and "error=" not in callback_url:
+            raise AuthenticationError("No authorization code or error in callback URL")
+
+        # Only the query matters here, so split it out without a full URL parse
+        query = callback_url.partition("?")[2].partition("#")[0]
+
+        # Single pass over the query; stop early once code and state are known,
+        # unless an error may still follow and must take precedence
+        may_have_error = "error=" in query
+        code = state = error_code = error_description = None
+        for pair in query.split("&"):
+            key, _, value = pair.partition("=")
+            if not value:
+                continue
+            if key == "code" and code is None:
+                code = urllib.parse.unquote_plus(value)
+            elif key == "state" and state is None:
+                state = urllib.parse.unquote_plus(value)
+            elif key == "error" and error_code is None:
+                error_code = urllib.parse.unquote_plus(value)
+            elif key == "error_description" and error_description is None:
+                error_description = urllib.parse.unquote_plus(value)
+            if code is not None and state is not None and not may_have_error:
+                break
 
         # Check for error first
-        if "error" in params:
-            error_code = params["error"][0]
-            error_description = params.get("error_description", ["Unknown error"])[0]
+        if error_code is not None:
             raise AuthenticationError(
-                f"Authorization failed: {error_code} - {error_description}"
+                f"Authorization failed: {error_code} - "
+                f"{error_description or 'Unknown error'}"
             )
 
-        # Extract code
-        code_list = params.get("code")
-        if not code_list:
+        if code is None:
             raise AuthenticationError("No authorization code found in callback URL")
 
-        code = code_list[0]
-        state = params.get("state", [None])[0]
-
         return code, state
@@ -5,11 +5,16 @@ This module provides a high-level interface to the Volvo Cars API,
 handling authentication and providing methods for various API endpoints.
 """
 
+import copy
 import json
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import logging
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .auth import VolvoAuth
 from .exceptions import (
@@ -20,6 +25,93 @@ from .exceptions import (
     VolvoAPIError,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional, faster decoding of API responses
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# the stdlib exception regardless of which decoder is in use
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
+
+
+def _handle_response(response) -> Dict[str, Any]:
+    """
+    Map an HTTP response to parsed JSON data or the matching API exception
+
+    Works with both requests and httpx responses.
+
+    Args:
+        response: HTTP response object
+
+    Returns:
+        JSON response data
+
+    Raises:
+        VolvoAPIError: For API errors
+        AuthenticationError: For auth errors
+        RateLimitError: When rate limited
+    """
+    # Handle different response codes
+    if response.status_code == 401:
+        raise AuthenticationError("Authentication failed - invalid or expired token")
+    elif response.status_code == 403:
+        raise AuthenticationError("Access forbidden - insufficient permissions")
+    elif response.status_code == 404:
+        raise VehicleNotFoundError("Vehicle not found or not accessible")
+    elif response.status_code == 429:
+        raise RateLimitError("Rate limit exceeded", status_code=429)
+    elif response.status_code >= 400:
+        error_data = None
+        if "json" in response.headers.get("Content-Type", ""):
+            try:
+                error_data = _json_loads(response.content)
+            except json.JSONDecodeError:
+                pass
+        if not isinstance(error_data, dict):
+            error_data = {"message": response.text}
+
+        raise VolvoAPIError(
+            f"API request failed: {error_data.get('message', 'Unknown error')}",
+            status_code=response.status_code,
+            response_data=error_data,
+        )
+
+    # Command endpoints often return empty or non-JSON bodies; skip the parser
+    if response.status_code == 204 or not response.content:
+        return {"status": "success"}
+    if "json" not in response.headers.get("Content-Type", ""):
+        return {"status": "success", "raw": response.text}
+
+    try:
+        return _json_loads(response.content)
+    except json.JSONDecodeError:
+        return {"status": "success"}
+
+
+# Endpoint path templates, shared with AsyncVolvoAPIClient
+_EP_VEHICLES = "/connected-vehicle/v2/vehicles"
+_EP_VEHICLE = "/connected-vehicle/v2/vehicles/{vin}"
+_EP_ENERGY_STATE = "/energy/v2/vehicles/{vin}/state"
+_EP_ENERGY_CAPABILITIES = "/energy/v2/vehicles/{vin}/capabilities"
+_EP_FUEL = "/connected-vehicle/v2/vehicles/{vin}/fuel"
+_EP_ODOMETER = "/connected-vehicle/v2/vehicles/{vin}/odometer"
+_EP_LOCATION = "/location/v1/vehicles/{vin}/location"
+_EP_WARNINGS = "/connected-vehicle/v2/vehicles/{vin}/warnings"
+_EP_DOORS = "/connected-vehicle/v2/vehicles/{vin}/doors"
+_EP_WINDOWS = "/connected-vehicle/v2/vehicles/{vin}/windows"
+_EP_BRAKE_FLUID = "/connected-vehicle/v2/vehicles/{vin}/brake-fluid"
+_EP_WASHER_FLUID = "/connected-vehicle/v2/vehicles/{vin}/washer-fluid"
+_EP_TYRES = "/connected-vehicle/v2/vehicles/{vin}/tyres"
+_EP_LOCK = "/connected-vehicle/v2/vehicles/{vin}/commands/lock"
+_EP_UNLOCK = "/connected-vehicle/v2/vehicles/{vin}/commands/unlock"
+_EP_ENGINE_START = "/connected-vehicle/v2/vehicles/{vin}/commands/engine-start"
+_EP_ENGINE_STOP = "/connected-vehicle/v2/vehicles/{vin}/commands/engine-stop"
+_EP_CLIMATE_START = "/connected-vehicle/v2/vehicles/{vin}/commands/climatization-start"
+_EP_CLIMATE_STOP = "/connected-vehicle/v2/vehicles/{vin}/commands/climatization-stop"
+
 
 class VolvoAPIClient:
     """
@@ -29,12 +121,32 @@ class VolvoAPIClient:
     # Volvo API base URL
     API_BASE_URL = "https://api.volvocars.com"
 
+    # Cache lifetimes in seconds for idempotent GET endpoints; endpoints not
+    # matched here are always fetched from the API
+    _CACHE_TTLS = (
+        (re.compile(r"^/connected-vehicle/v2/vehicles$"), 600),
+        (re.compile(r"^/connected-vehicle/v2/vehicles/[^/]+$"), 3600),
+        (re.compile(r"^/connected-vehicle/v2/vehicles/[^/]+/odometer$"), 300),
+        (re.compile(r"^/energy/v2/vehicles/[^/]+/capabilities$"), 86400),
+        # Short-lived so the energy accessors share one fetch without
+        # serving stale charging data
+        (re.compile(r"^/energy/v2/vehicles/[^/]+/state$"), 15),
+    )
+
+    # Transient gateway errors worth retrying with backoff
+    _RETRY_STATUSES = frozenset((502, 503, 504))
+
+    # Longest we are willing to block before a retry, in seconds
+    _MAX_RETRY_DELAY = 60.0
+
     def __init__(
         self,
         auth: VolvoAuth,
         vcc_api_key: str,
         api_base_url: Optional[str] = None,
         timeout: int = 30,
+        max_retries: int = 3,
+        use_http2: bool = False,
     ):
         """
         Initialize Volvo API client
@@ -44,11 +156,97 @@ class VolvoAPIClient:
             vcc_api_key: VCC API key from your Volvo Developer Portal application
             api_base_url: Override default API base URL
             timeout: Request timeout in seconds
+            max_retries: Retries for rate limiting and transient failures
+            use_http2: Send requests over a multiplexed HTTP/2 connection
+                (requires the optional httpx package with HTTP/2 support)
         """
         self.auth = auth
         self.vcc_api_key = vcc_api_key
-        self.api_base_url = api_base_url or self.API_BASE_URL
+        self.api_base_url = (api_base_url or self.API_BASE_URL).rstrip("/")
         self.timeout = timeout
+        self.max_retries = max_retries
+
+        # Pooled keep-alive session; static headers are set once here and
+        # only the Authorization header is added per request
+        static_headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "vcc-api-key": vcc_api_key,
+        }
+        if use_http2:
+            # Imported here so the default requests transport doesn't pay for it
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "httpx is required for use_http2: pip install 'httpx[http2]'"
+                ) from e
+            self._session = httpx.Client(
+                http2=True, timeout=timeout, headers=static_headers
+            )
+            self._connection_errors = (httpx.NetworkError,)
+            self._request_errors = (httpx.HTTPError,)
+        else:
+            self._session = requests.Session()
+            self._session.headers.update(static_headers)
+            self._session.mount(
+                "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            )
+            self._connection_errors = (requests.exceptions.ConnectionError,)
+            self._request_errors = (requests.exceptions.RequestException,)
+
+        # (access token, "Bearer ..." header) for the most recent token
+        self._auth_header: Tuple[Optional[str], str] = (None, "")
+
+        # Cached GET responses: (endpoint, params) -> (monotonic time, data)
+        self._cache: Dict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]] = {}
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def invalidate(self, vin: Optional[str] = None):
+        """
+        Drop cached responses so the next call goes to the API
+
+        Args:
+            vin: Only drop responses for this vehicle (default: drop all)
+        """
+        if vin is None:
+            self._cache.clear()
+            return
+
+        for key in [key for key in self._cache if vin in key[0]]:
+            self._cache.pop(key, None)
+
+    def _cache_ttl(self, endpoint: str) -> Optional[int]:
+        """Return the cache lifetime for an endpoint, or None if uncacheable"""
+        for pattern, ttl in self._CACHE_TTLS:
+            if pattern.match(endpoint):
+                return ttl
+        return None
+
+    @staticmethod
+    def _retry_after(response, attempt: int) -> float:
+        """Delay requested by the server, or exponential backoff if absent"""
+        try:
+            # Never negative: time.sleep() rejects negative durations
+            return max(0.0, float(response.headers["Retry-After"]))
+        except (KeyError, ValueError):
+            return float(2**attempt)
+
+    def _sleep_before_retry(self, delay: float):
+        """Sleep for a capped delay plus jitter so clients don't retry in sync"""
+        delay = min(delay, self._MAX_RETRY_DELAY)
+        time.sleep(delay + random.uniform(0, 0.5 * delay))
 
     def _make_request(
         self,
@@ -62,8 +260,8 @@ class VolvoAPIClient:
         Make authenticated request to Volvo API
 
         Args:
-            method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
+            method: Upper-case HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path starting with "/"
             params: Query parameters
             data: Form data
             json_data: JSON data
@@ -76,68 +274,83 @@ class VolvoAPIClient:
             AuthenticationError: For auth errors
             RateLimitError: When rate limited
         """
+        # Serve idempotent reads from the cache while they are fresh
+        cache_key = None
+        cache_ttl = self._cache_ttl(endpoint) if method == "GET" else None
+        if cache_ttl is not None:
+            cache_key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+                # Hand out a copy so callers can't mutate the cached entry
+                return copy.deepcopy(cached[1])
+
         # Get valid access token
         try:
             access_token = self.auth.get_access_token()
         except Exception as e:
             raise AuthenticationError(f"Failed to get access token: {str(e)}") from e
 
-        # Build full URL
-        url = urljoin(self.api_base_url, endpoint.lstrip("/"))
+        # Endpoints always start with "/", so plain concatenation is enough
+        url = self.api_base_url + endpoint
 
-        # Prepare headers
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "vcc-api-key": self.vcc_api_key,
-        }
+        # Rebuild the Authorization header only when the token rotates
+        auth_token, auth_header = self._auth_header
+        if auth_token is not access_token:
+            auth_header = f"Bearer {access_token}"
+            self._auth_header = (access_token, auth_header)
 
-        try:
-            response = requests.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data,
-                data=data,
-                timeout=self.timeout,
-            )
+        # Only reads are safe to resend after a dropped connection or a
+        # gateway error; rate-limited requests were never processed
+        idempotent = method == "GET"
+
+        for attempt in range(self.max_retries + 1):
+            can_retry = attempt < self.max_retries
 
-            # Handle different response codes
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Authentication failed - invalid or expired token"
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    headers={"Authorization": auth_header},
+                    params=params,
+                    json=json_data,
+                    data=data,
+                    timeout=self.timeout,
                 )
-            elif response.status_code == 403:
-                raise AuthenticationError("Access forbidden - insufficient permissions")
-            elif response.status_code == 404:
-                raise VehicleNotFoundError("Vehicle not found or not accessible")
-            elif response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded", status_code=429)
-            elif response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                except json.JSONDecodeError:
-                    error_data = {"message": response.text}
-
-                raise VolvoAPIError(
-                    f"API request failed: {error_data.get('message', 'Unknown error')}",
-                    status_code=response.status_code,
-                    response_data=error_data,
+            except self._connection_errors as e:
+                if can_retry and idempotent:
+                    self._sleep_before_retry(2**attempt)
+                    continue
+                raise VolvoAPIError(f"Request failed: {str(e)}") from e
+            except self._request_errors as e:
+                raise VolvoAPIError(f"Request failed: {str(e)}") from e
+
+            if response.status_code == 429:
+                retry_after = self._retry_after(response, attempt)
+                if can_retry and retry_after <= self._MAX_RETRY_DELAY:
+                    self._sleep_before_retry(retry_after)
+                    continue
+                raise RateLimitError(
+                    "Rate limit exceeded",
+                    status_code=429,
+                    response_data={"retry_after": retry_after},
                 )
 
-            response.raise_for_status()
+            if (
+                response.status_code in self._RETRY_STATUSES
+                and can_retry
+                and idempotent
+            ):
+                self._sleep_before_retry(self._retry_after(response, attempt))
+                continue
 
-            # Try to parse JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                # Some endpoints might return empty responses
-                return {"status": "success"}
+            break
+
+        result = _handle_response(response)
+
+        if cache_key is not None:
+            self._cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
 
-        except requests.exceptions.RequestException as e:
-            raise VolvoAPIError(f"Request failed: {str(e)}") from e
+        return result
 
     def get_vehicles(self) -> List[Dict[str, Any]]:
         """
@@ -146,7 +359,7 @@ class VolvoAPIClient:
         Returns:
             List of vehicle information
         """
-        response = self._make_request("GET", "/connected-vehicle/v2/vehicles")
+        response = self._make_request("GET", _EP_VEHICLES)
         return response.get("data", [])
 
     def get_vehicle_details(self, vin: str) -> Dict[str, Any]:
@@ -159,7 +372,7 @@ class VolvoAPIClient:
         Returns:
             Vehicle details
         """
-        response = self._make_request("GET", f"/connected-vehicle/v2/vehicles/{vin}")
+        response = self._make_request("GET", _EP_VEHICLE.format(vin=vin))
         return response.get("data", {})
 
     def get_energy_state(self, vin: str) -> Dict[str, Any]:
@@ -183,7 +396,7 @@ class VolvoAPIClient:
             - chargingPower: Current charging power
             - estimatedChargingTimeToTargetBatteryChargeLevel: Time to target
         """
-        response = self._make_request("GET", f"/energy/v2/vehicles/{vin}/state")
+        response = self._make_request("GET", _EP_ENERGY_STATE.format(vin=vin))
         # Energy API v2 returns data directly, not wrapped in "data" field
         return response
 
@@ -200,8 +413,8 @@ class VolvoAPIClient:
         Returns:
             Energy capabilities information including supported features
         """
-        response = self._make_request("GET", f"/energy/v2/vehicles/{vin}/capabilities")
-        print(response)
+        response = self._make_request("GET", _EP_ENERGY_CAPABILITIES.format(vin=vin))
+        logger.debug("Energy capabilities response: %s", response)
         return response.get("data", {})
 
     def get_battery_charge_level(self, vin: str) -> Dict[str, Any]:
@@ -210,6 +423,7 @@ class VolvoAPIClient:
 
         This is a convenience method that extracts just the battery charge level
         from the full energy state. For comprehensive energy data, use get_energy_state().
+        The energy state is cached briefly, so calling both costs one request.
 
         Args:
             vin: Vehicle identification number
@@ -236,9 +450,7 @@ class VolvoAPIClient:
         Returns:
             Fuel status information
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/fuel"
-        )
+        response = self._make_request("GET", _EP_FUEL.format(vin=vin))
         return response.get("data", {})
 
     def get_odometer(self, vin: str) -> Dict[str, Any]:
@@ -251,9 +463,7 @@ class VolvoAPIClient:
         Returns:
             Odometer information
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/odometer"
-        )
+        response = self._make_request("GET", _EP_ODOMETER.format(vin=vin))
         return response.get("data", {})
 
     def get_location(self, vin: str) -> Dict[str, Any]:
@@ -266,7 +476,7 @@ class VolvoAPIClient:
         Returns:
             Location information
         """
-        response = self._make_request("GET", f"/location/v1/vehicles/{vin}/location")
+        response = self._make_request("GET", _EP_LOCATION.format(vin=vin))
         return response.get("data", {})
 
     def get_engine_status(self, vin: str) -> Dict[str, Any]:
@@ -275,7 +485,8 @@ class VolvoAPIClient:
 
         Note: This method is kept for compatibility but calls the same
         endpoint as get_energy_state since engine status is part of
-        the energy state in Volvo's API.
+        the energy state in Volvo's API. The cached energy state is reused
+        when it was fetched within the last few seconds.
 
         Args:
             vin: Vehicle identification number
@@ -295,9 +506,7 @@ class VolvoAPIClient:
         Returns:
             List of warnings
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/warnings"
-        )
+        response = self._make_request("GET", _EP_WARNINGS.format(vin=vin))
         return response.get("data", [])
 
     def get_doors_status(self, vin: str) -> Dict[str, Any]:
@@ -310,9 +519,7 @@ class VolvoAPIClient:
         Returns:
             Doors and windows status
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/doors"
-        )
+        response = self._make_request("GET", _EP_DOORS.format(vin=vin))
         return response.get("data", {})
 
     def get_windows_status(self, vin: str) -> Dict[str, Any]:
@@ -325,9 +532,7 @@ class VolvoAPIClient:
         Returns:
             Windows status information
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/windows"
-        )
+        response = self._make_request("GET", _EP_WINDOWS.format(vin=vin))
         return response.get("data", {})
 
     def get_brake_fluid_status(self, vin: str) -> Dict[str, Any]:
@@ -340,9 +545,7 @@ class VolvoAPIClient:
         Returns:
             Brake fluid status
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/brake-fluid"
-        )
+        response = self._make_request("GET", _EP_BRAKE_FLUID.format(vin=vin))
         return response.get("data", {})
 
     def get_washer_fluid_status(self, vin: str) -> Dict[str, Any]:
@@ -355,9 +558,7 @@ class VolvoAPIClient:
         Returns:
             Washer fluid status
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/washer-fluid"
-        )
+        response = self._make_request("GET", _EP_WASHER_FLUID.format(vin=vin))
         return response.get("data", {})
 
     def get_tyre_status(self, vin: str) -> Dict[str, Any]:
@@ -370,9 +571,7 @@ class VolvoAPIClient:
         Returns:
             Tyre status information
         """
-        response = self._make_request(
-            "GET", f"/connected-vehicle/v2/vehicles/{vin}/tyres"
-        )
+        response = self._make_request("GET", _EP_TYRES.format(vin=vin))
         return response.get("data", {})
 
     # Command methods (require appropriate permissions)
@@ -387,9 +586,8 @@ class VolvoAPIClient:
         Returns:
             Command result
         """
-        response = self._make_request(
-            "POST", f"/connected-vehicle/v2/vehicles/{vin}/commands/lock"
-        )
+        response = self._make_request("POST", _EP_LOCK.format(vin=vin))
+        self.invalidate(vin)
         return response.get("data", {})
 
     def unlock_vehicle(self, vin: str) -> Dict[str, Any]:
@@ -402,9 +600,8 @@ class VolvoAPIClient:
         Returns:
             Command result
         """
-        response = self._make_request(
-            "POST", f"/connected-vehicle/v2/vehicles/{vin}/commands/unlock"
-        )
+        response = self._make_request("POST", _EP_UNLOCK.format(vin=vin))
+        self.invalidate(vin)
         return response.get("data", {})
 
     def start_engine(self, vin: str, runtime_minutes: int = 15) -> Dict[str, Any]:
@@ -421,9 +618,10 @@ class VolvoAPIClient:
         json_data = {"runtime": runtime_minutes}
         response = self._make_request(
             "POST",
-            f"/connected-vehicle/v2/vehicles/{vin}/commands/engine-start",
+            _EP_ENGINE_START.format(vin=vin),
             json_data=json_data,
         )
+        self.invalidate(vin)
         return response.get("data", {})
 
     def stop_engine(self, vin: str) -> Dict[str, Any]:
@@ -436,9 +634,8 @@ class VolvoAPIClient:
         Returns:
             Command result
         """
-        response = self._make_request(
-            "POST", f"/connected-vehicle/v2/vehicles/{vin}/commands/engine-stop"
-        )
+        response = self._make_request("POST", _EP_ENGINE_STOP.format(vin=vin))
+        self.invalidate(vin)
         return response.get("data", {})
 
     def start_climate(
@@ -460,9 +657,10 @@ class VolvoAPIClient:
 
         response = self._make_request(
             "POST",
-            f"/connected-vehicle/v2/vehicles/{vin}/commands/climatization-start",
+            _EP_CLIMATE_START.format(vin=vin),
             json_data=json_data,
         )
+        self.invalidate(vin)
         return response.get("data", {})
 
     def stop_climate(self, vin: str) -> Dict[str, Any]:
@@ -475,7 +673,6 @@ class VolvoAPIClient:
         Returns:
             Command result
         """
-        response = self._make_request(
-            "POST", f"/connected-vehicle/v2/vehicles/{vin}/commands/climatization-stop"
-        )
+        response = self._make_request("POST", _EP_CLIMATE_STOP.format(vin=vin))
+        self.invalidate(vin)
         return response.get("data", {})
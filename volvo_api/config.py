@@ -3,16 +3,37 @@ Configuration management for Volvo API client
 """
 
 import os
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 
+# Modification time of each env file at the point it was loaded, so repeated
+# VolvoConfig construction doesn't re-parse an unchanged file
+_LOADED_ENV: Dict[str, float] = {}
+
 
 class VolvoConfig:
-    """Configuration management for Volvo API"""
+    """
+    Configuration management for Volvo API
+
+    Environment values are read once per instance and then cached; call
+    invalidate() to pick up changes made to the environment afterwards.
+    """
+
+    # Names of the cached environment-backed properties
+    _ENV_PROPERTIES = (
+        "client_id",
+        "client_secret",
+        "redirect_uri",
+        "vin",
+        "vcc_api_key",
+        "api_base_url",
+        "auth_base_url",
+    )
 
     # Default scopes for various use cases
-    DEFAULT_SCOPES = [
+    DEFAULT_SCOPES: Tuple[str, ...] = (
         "openid",
         "conve:battery_charge_level",
         "conve:commands",
@@ -26,20 +47,24 @@ class VolvoConfig:
         "energy:capability:read",
         # Location API scope
         "location:read",
-    ]
+    )
 
-    BASIC_SCOPES = [
+    BASIC_SCOPES: Tuple[str, ...] = (
         "openid",
         "conve:vehicle_relation",
         "conve:fuel_status",
         "conve:battery_charge_level",
         # Basic energy access
         "energy:state:read",
-    ]
+    )
 
-    COMMAND_SCOPES = ["openid", "conve:commands", "conve:vehicle_relation"]
+    COMMAND_SCOPES: Tuple[str, ...] = (
+        "openid",
+        "conve:commands",
+        "conve:vehicle_relation",
+    )
 
-    ALL_AVAILABLE_SCOPES = [
+    ALL_AVAILABLE_SCOPES: Tuple[str, ...] = (
         "openid",
         "conve:battery_charge_level",
         "conve:commands",
@@ -59,7 +84,15 @@ class VolvoConfig:
         "energy:capability:read",
         # Location API scopes
         "location:read",
-    ]
+    )
+
+    # Scope sets by category name, looked up by get_scopes_by_category
+    _CATEGORY_MAP: Dict[str, Tuple[str, ...]] = {
+        "default": DEFAULT_SCOPES,
+        "basic": BASIC_SCOPES,
+        "command": COMMAND_SCOPES,
+        "all": ALL_AVAILABLE_SCOPES,
+    }
 
     def __init__(self, env_file: str = ".env"):
         """
@@ -69,44 +102,55 @@ class VolvoConfig:
             env_file: Path to environment file
         """
         # Load environment variables
-        if os.path.exists(env_file):
-            load_dotenv(env_file)
+        try:
+            mtime = os.stat(env_file).st_mtime
+        except OSError:
+            return
 
-    @property
+        if _LOADED_ENV.get(env_file) != mtime:
+            load_dotenv(env_file, override=False)
+            _LOADED_ENV[env_file] = mtime
+
+    @cached_property
     def client_id(self) -> Optional[str]:
         """Get client ID from environment"""
         return os.getenv("VOLVO_CLIENT_ID")
 
-    @property
+    @cached_property
     def client_secret(self) -> Optional[str]:
         """Get client secret from environment"""
         return os.getenv("VOLVO_CLIENT_SECRET")
 
-    @property
+    @cached_property
     def redirect_uri(self) -> Optional[str]:
         """Get redirect URI from environment"""
         return os.getenv("VOLVO_REDIRECT_URI")
 
-    @property
+    @cached_property
     def vin(self) -> Optional[str]:
         """Get VIN from environment"""
         return os.getenv("VOLVO_VIN")
 
-    @property
+    @cached_property
     def vcc_api_key(self) -> Optional[str]:
         """Get VCC API key from environment"""
         return os.getenv("VOLVO_VCC_API_KEY")
 
-    @property
+    @cached_property
     def api_base_url(self) -> str:
         """Get API base URL from environment or default"""
         return os.getenv("VOLVO_API_BASE_URL", "https://api.volvocars.com")
 
-    @property
+    @cached_property
     def auth_base_url(self) -> str:
         """Get auth base URL from environment or default"""
         return os.getenv("VOLVO_AUTH_BASE_URL", "https://volvoid.eu.volvocars.com")
 
+    def invalidate(self):
+        """Drop cached environment values so they are re-read on next access"""
+        for name in self._ENV_PROPERTIES:
+            self.__dict__.pop(name, None)
+
     def validate(self) -> List[str]:
         """
         Validate configuration and return list of missing required fields
@@ -131,7 +175,7 @@ class VolvoConfig:
         """Check if configuration is valid"""
         return len(self.validate()) == 0
 
-    def get_scopes_by_category(self, category: str = "default") -> List[str]:
+    def get_scopes_by_category(self, category: str = "default") -> Sequence[str]:
         """
         Get scopes by category
 
@@ -139,16 +183,9 @@ class VolvoConfig:
             category: Scope category ("default", "basic", "command", "all")
 
         Returns:
-            List of scopes for the category
+            Immutable sequence of scopes for the category
         """
-        category_map = {
-            "default": self.DEFAULT_SCOPES,
-            "basic": self.BASIC_SCOPES,
-            "command": self.COMMAND_SCOPES,
-            "all": self.ALL_AVAILABLE_SCOPES,
-        }
-
-        return category_map.get(category.lower(), self.DEFAULT_SCOPES)
+        return self._CATEGORY_MAP.get(category.lower(), self.DEFAULT_SCOPES)
 
     def to_dict(self) -> Dict[str, Optional[str]]:
         """
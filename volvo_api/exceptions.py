@@ -6,46 +6,53 @@ Custom exceptions for Volvo API client
 class VolvoAPIError(Exception):
     """Base exception for Volvo API errors"""
 
+    __slots__ = ("message", "status_code", "response_data")
+
     def __init__(
         self, message: str, status_code: int = None, response_data: dict = None
     ):
         self.message = message
         self.status_code = status_code
-        self.response_data = response_data or {}
+        self.response_data = response_data if response_data is not None else {}
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # BaseException only pickles args and __dict__, which would drop the
+        # slot values when errors are copied or sent between processes
+        return (type(self), (self.message, self.status_code, self.response_data))
+
 
 class AuthenticationError(VolvoAPIError):
     """Raised when authentication fails"""
 
-    pass
+    __slots__ = ()
 
 
 class AuthorizationError(VolvoAPIError):
     """Raised when authorization fails"""
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(VolvoAPIError):
     """Raised when rate limit is exceeded"""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidTokenError(AuthenticationError):
     """Raised when token is invalid or expired"""
 
-    pass
+    __slots__ = ()
 
 
 class VehicleNotFoundError(VolvoAPIError):
     """Raised when vehicle is not found or not accessible"""
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(VolvoAPIError):
     """Raised when request data validation fails"""
 
-    pass
+    __slots__ = ()